@@ -1,11 +1,19 @@
 import asyncio
 import aiohttp
+import aiosqlite
 import logging
+import math
+import orjson
+import re
+import signal
+import time
+import urllib.parse
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict, Optional
-from dataclasses import dataclass
+from typing import Dict, Optional, Set, Tuple
+from dataclasses import dataclass, field
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.ext import Application, CommandHandler, CallbackQueryHandler, MessageHandler, filters, ContextTypes
+from telegram.ext import AIORateLimiter, Application, CommandHandler, CallbackQueryHandler, MessageHandler, filters, ContextTypes
 
 # Configure logging
 logging.basicConfig(
@@ -14,29 +22,137 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# How long a fetched price is reused before asking Binance again (seconds)
+PRICE_CACHE_TTL = 15
+
+# Binance HTTP limits: explicit timeouts and retries so a slow API can't hang the bot
+BINANCE_TIMEOUT = aiohttp.ClientTimeout(total=5, connect=2)
+BINANCE_MAX_RETRIES = 3
+BINANCE_RETRY_BACKOFF = 0.5  # seconds, doubled on each retry
+BINANCE_MAX_CONCURRENCY = 10  # in-flight requests, protects the API weight limit
+BINANCE_DEFAULT_RETRY_AFTER = 60  # seconds to back off on 429/418 without a Retry-After header
+
+# How long the list of valid Binance symbols is kept before refreshing (seconds)
+SYMBOLS_REFRESH_INTERVAL = 24 * 60 * 60
+SYMBOLS_RETRY_INTERVAL = 5 * 60  # wait after a failed refresh before trying again
+
+# Binance symbol format (same rule as exchangeInfo) and remove-button callback data
+SYMBOL_RE = re.compile(r"^[A-Z0-9\-_.]{1,20}$")
+REMOVE_CALLBACK_RE = re.compile(r"^rm:(\d+)$")
+
+# Message templates (formatted once per level/alert)
+LIST_ROW_TMPL = (
+    "{status_emoji} **{index}. {symbol}**\n"
+    "🎯 Target: ${target:,.4f}\n"
+    "💰 Current: {price_text}\n"
+    "📊 Distance: {distance_text}\n"
+    "📅 Added: {added}\n\n"
+)
+
+ALERT_TMPL = (
+    "🚨 **TARGET HIT!** 🚨\n\n"
+    "📊 **{symbol}** dropped to your level!\n\n"
+    "🎯 **Target:** ${target:,.4f}\n"
+    "💰 **Current:** ${current:,.4f}\n"
+    "📉 **Extra Drop:** {drop:.2f}% below target\n\n"
+    "⏰ **Time:** {time}\n\n"
+    "🚀 **Perfect for long entry!** This level has been removed from monitoring.\n\n"
+    "_Add new levels with /add command_"
+)
+
+# Adaptive polling: levels close to their target are checked more often
+HOT_DISTANCE_PCT = 1.0     # within 1% of target
+HOT_POLL_INTERVAL = 30     # seconds
+WARM_DISTANCE_PCT = 5.0    # within 5% of target
+WARM_POLL_INTERVAL = 120   # seconds
+POLL_TOLERANCE = 1.0       # seconds early a level may be checked (absorbs job tick jitter)
+
+def format_interval(seconds: float) -> str:
+    """Human-readable poll interval for user-facing messages"""
+    if seconds >= 60 and seconds % 60 == 0:
+        minutes = int(seconds // 60)
+        return "1 minute" if minutes == 1 else f"{minutes} minutes"
+    return f"{seconds:g} seconds"
+
+class BinanceHTTPError(Exception):
+    """Binance answered with a non-200 status"""
+    def __init__(self, status: int, url: str):
+        super().__init__(f"Binance request failed with status {status}: {url}")
+        self.status = status
+
+class BinanceRateLimited(BinanceHTTPError):
+    """Binance asked us to slow down (429) or banned the IP (418)"""
+    def __init__(self, status: int, url: str, retry_after: float):
+        super().__init__(status, url)
+        self.retry_after = retry_after
+
 @dataclass
 class TargetLevel:
     symbol: str
     target_price: float
     created_at: datetime = None
+    next_poll_at: float = 0.0  # time.monotonic() deadline for the next price check
+    created_at_str: str = field(init=False)  # created_at formatted once for /list
     
     def __post_init__(self):
         if self.created_at is None:
             self.created_at = datetime.now()
+        self.created_at_str = self.created_at.strftime('%m/%d %H:%M')
 
 class CryptoLongEntryBot:
-    def __init__(self, bot_token: str):
+    def __init__(self, bot_token: str, poll_interval: float = 300.0, db_path: str = "levels.db",
+                 webhook_host: Optional[str] = None, webhook_port: int = 8443,
+                 webhook_secret: Optional[str] = None):
         self.bot_token = bot_token
-        self.user_levels: Dict[int, Dict[str, TargetLevel]] = {}  # user_id -> {symbol: TargetLevel}
+        self.db_path = db_path  # SQLite file holding user levels across restarts
+        self.webhook_host = webhook_host  # public HTTPS host; None falls back to long polling
+        self.webhook_port = webhook_port
+        self.webhook_secret = webhook_secret
+        self.poll_interval = poll_interval  # seconds between price checks
+        self.user_levels: Dict[int, Dict[str, TargetLevel]] = defaultdict(dict)  # user_id -> {symbol: TargetLevel}
+        self._watchers: Dict[str, Dict[int, TargetLevel]] = defaultdict(dict)  # symbol -> {user_id: TargetLevel}
         self.application = None
         self.monitoring = False
+        self._session: Optional[aiohttp.ClientSession] = None  # shared HTTP session for Binance
+        self._db: Optional[aiosqlite.Connection] = None  # shared connection for level persistence
+        self._binance_sem = asyncio.Semaphore(BINANCE_MAX_CONCURRENCY)
+        self._binance_backoff_until = 0.0  # monotonic time until which Binance asked us to back off
+        self._levels_lock = asyncio.Lock()  # keeps each database write and memory update together
+        self._callback_handlers = {  # callback_data prefix before ':' -> handler
+            "rm": self.remove_button_callback,
+            "cancel": self.cancel_button_callback,
+        }
+        self._stop_event = asyncio.Event()
+        self._price_cache: Dict[str, Tuple[float, float]] = {}  # symbol -> (price, monotonic expiry)
+        self._known_symbols: Optional[Set[str]] = None  # tradable symbols from exchangeInfo
+        self._known_symbols_expiry = 0.0
+        self._known_symbols_lock = asyncio.Lock()  # one exchangeInfo download at a time
         
     async def start_bot(self):
         """Initialize and start the Telegram bot"""
+        # Restore saved levels before anything can modify them
+        await self.load_levels()
+        
+        # One HTTP session for all Binance requests (keep-alive connection reuse)
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=50,
+                limit_per_host=20,
+                ttl_dns_cache=300,
+                keepalive_timeout=75
+            )
+        )
+        
         # Create application with simplified approach
         self.application = (
             Application.builder()
             .token(self.bot_token)
+            .connection_pool_size(64)
+            .pool_timeout(20)
+            .get_updates_connection_pool_size(1)
+            .connect_timeout(10)
+            .read_timeout(20)
+            .rate_limiter(AIORateLimiter(overall_max_rate=30, overall_time_period=1))
             .build()
         )
         
@@ -48,22 +164,69 @@ class CryptoLongEntryBot:
         self.application.add_handler(CommandHandler("remove", self.remove_level_command))
         self.application.add_handler(CallbackQueryHandler(self.button_callback))
         
-        # Start monitoring task
-        asyncio.create_task(self.price_monitoring_loop())
+        # Start the bot
+        await self.application.initialize()
+        await self.application.start()
+        
+        # Price monitoring runs on the PTB job queue, which stops it on shutdown.
+        # Ticks are cheap when nothing is due, so tick at the fastest adaptive rate.
+        check_interval = min(HOT_POLL_INTERVAL, self.poll_interval)
+        self.application.job_queue.run_repeating(self.monitor_job, interval=check_interval, first=5.0)
+        self.monitoring = True
+        logger.info(f"🔄 Started price monitoring (every {self.poll_interval:g} seconds, faster near targets)")
+        
+        if self.webhook_host:
+            # Telegram pushes updates to us (TLS terminated by the reverse proxy)
+            await self.application.updater.start_webhook(
+                listen="0.0.0.0",
+                port=self.webhook_port,
+                url_path=self.bot_token,
+                webhook_url=f"https://{self.webhook_host}/{self.bot_token}",
+                max_connections=40,
+                secret_token=self.webhook_secret,
+                drop_pending_updates=True
+            )
+            logger.info(f"🌐 Receiving updates via webhook on port {self.webhook_port}")
+        else:
+            # Long polling: hold each getUpdates request open to batch updates
+            await self.application.updater.start_polling(
+                poll_interval=1.0,
+                timeout=30,
+                drop_pending_updates=True
+            )
         
         logger.info("Long Entry Alert Bot started successfully!")
         
-        # Run the bot with run_polling (newer approach)
-        await self.application.run_polling(drop_pending_updates=True)
+        # Run until SIGINT/SIGTERM, then shut down cleanly
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self._stop_event.set)
+            
+        await self._stop_event.wait()
+        await self.shutdown()
+        
+    async def shutdown(self):
+        """Stop the Telegram bot and close the shared HTTP session"""
+        logger.info("👋 Shutting down bot...")
         
+        if self.application:
+            if self.application.updater and self.application.updater.running:
+                await self.application.updater.stop()
+            if self.application.running:
+                await self.application.stop()
+            await self.application.shutdown()
+            
+        if self._session and not self._session.closed:
+            await self._session.close()
+            
+        if self._db:
+            await self._db.close()
+            
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command"""
         user_id = update.effective_user.id
         
-        if user_id not in self.user_levels:
-            self.user_levels[user_id] = {}
-            
-        welcome_text = """🎯 **Crypto Long Entry Alert Bot**
+        welcome_text = f"""🎯 **Crypto Long Entry Alert Bot**
 
 I'll monitor your target levels and alert you when prices drop to your entry zones!
 
@@ -75,7 +238,7 @@ I'll monitor your target levels and alert you when prices drop to your entry zon
 
 **How it works:**
 1. Add your target entry levels
-2. I monitor prices every 5 minutes
+2. I monitor prices every {format_interval(self.poll_interval)} (faster near your target)
 3. When price drops to/below your level → ALERT! 🚨
 4. Level gets deleted automatically after alert
 
@@ -88,7 +251,7 @@ Ready to catch those dips! 📉💰"""
         
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /help command"""
-        help_text = """📖 **Detailed Guide**
+        help_text = f"""📖 **Detailed Guide**
 
 **Add Target Level:**
 `/add <SYMBOL> <PRICE>`
@@ -110,7 +273,7 @@ Ready to catch those dips! 📉💰"""
 • `/remove SYMBOL` - Manually remove a target
 
 **Monitoring:**
-✅ Checks every 5 minutes
+✅ Checks every {format_interval(self.poll_interval)}, faster near your target
 ✅ Only monitors symbols you add
 ✅ Stops monitoring after alert sent
 
@@ -122,9 +285,6 @@ Let's catch those perfect entries! 🎯"""
         """Handle /add command"""
         user_id = update.effective_user.id
         
-        if user_id not in self.user_levels:
-            self.user_levels[user_id] = {}
-            
         try:
             args = context.args
             if len(args) != 2:
@@ -138,8 +298,21 @@ Let's catch those perfect entries! 🎯"""
                 
             symbol = args[0].upper()
             target_price = float(args[1])
-            
-            # Validate symbol by checking current price
+            if not (math.isfinite(target_price) and target_price > 0):
+                raise ValueError(f"target price must be a positive number, got {args[1]}")
+                
+            # Reject malformed input without any network call, then check the
+            # cached exchange symbol list
+            if not SYMBOL_RE.match(symbol):
+                await update.message.reply_text(f"❌ **Invalid symbol:** `{symbol}`\n\nMake sure it exists on Binance!", parse_mode='Markdown')
+                return
+                
+            known_symbols = await self.get_known_symbols()
+            if known_symbols is not None and symbol not in known_symbols:
+                await update.message.reply_text(f"❌ **Invalid symbol:** `{symbol}`\n\nMake sure it exists on Binance!", parse_mode='Markdown')
+                return
+                
+            # Current price (served from cache when recently fetched)
             current_price = await self.get_binance_price(symbol)
             if current_price is None:
                 await update.message.reply_text(f"❌ **Invalid symbol:** `{symbol}`\n\nMake sure it exists on Binance!", parse_mode='Markdown')
@@ -154,12 +327,13 @@ Let's catch those perfect entries! 🎯"""
                 )
                 
             # Check if updating existing level
-            is_update = symbol in self.user_levels[user_id]
-            old_price = self.user_levels[user_id][symbol].target_price if is_update else None
+            existing = self.user_levels.get(user_id, {}).get(symbol)
+            is_update = existing is not None
+            old_price = existing.target_price if is_update else None
             
             # Create/update the target level
             level = TargetLevel(symbol=symbol, target_price=target_price)
-            self.user_levels[user_id][symbol] = level
+            await self.set_level(user_id, level, current_price)
             
             if is_update:
                 await update.message.reply_text(
@@ -183,7 +357,7 @@ Let's catch those perfect entries! 🎯"""
                 )
             
         except ValueError:
-            await update.message.reply_text("❌ **Invalid price!** Please enter a valid number.", parse_mode='Markdown')
+            await update.message.reply_text("❌ **Invalid price!** Please enter a positive number.", parse_mode='Markdown')
         except Exception as e:
             logger.error(f"Error in add_level_command: {e}")
             await update.message.reply_text("❌ An error occurred. Please try again.")
@@ -192,7 +366,8 @@ Let's catch those perfect entries! 🎯"""
         """Handle /list command"""
         user_id = update.effective_user.id
         
-        if user_id not in self.user_levels or not self.user_levels[user_id]:
+        user_levels = self.user_levels.get(user_id, {})
+        if not user_levels:
             await update.message.reply_text(
                 "📭 **No active levels!**\n\n"
                 "Add your first target with:\n"
@@ -201,11 +376,19 @@ Let's catch those perfect entries! 🎯"""
             )
             return
             
-        levels_text = f"📋 **Your Target Levels** ({len(self.user_levels[user_id])} active)\n\n"
+        rows = [f"📋 **Your Target Levels** ({len(user_levels)} active)\n\n"]
         
-        for i, (symbol, level) in enumerate(self.user_levels[user_id].items(), 1):
-            current_price = await self.get_binance_price(symbol)
-            
+        # Fetch all prices concurrently (cached ones return immediately)
+        levels = list(user_levels.items())
+        prices = await asyncio.gather(
+            *(self.get_binance_price(symbol) for symbol, _ in levels),
+            return_exceptions=True
+        )
+        
+        for i, ((symbol, level), current_price) in enumerate(zip(levels, prices), 1):
+            if isinstance(current_price, Exception):
+                current_price = None
+                
             if current_price:
                 distance_pct = ((level.target_price - current_price) / current_price * 100)
                 distance_text = f"{distance_pct:+.2f}%"
@@ -221,34 +404,46 @@ Let's catch those perfect entries! 🎯"""
                 price_text = "N/A"
                 status_emoji = "❓"
                 
-            levels_text += (
-                f"{status_emoji} **{i}. {symbol}**\n"
-                f"🎯 Target: ${level.target_price:,.4f}\n"
-                f"💰 Current: {price_text}\n"
-                f"📊 Distance: {distance_text}\n"
-                f"📅 Added: {level.created_at.strftime('%m/%d %H:%M')}\n\n"
-            )
+            rows.append(LIST_ROW_TMPL.format(
+                status_emoji=status_emoji,
+                index=i,
+                symbol=symbol,
+                target=level.target_price,
+                price_text=price_text,
+                distance_text=distance_text,
+                added=level.created_at_str
+            ))
             
-        levels_text += "_I check these every 5 minutes! 🕐_"
+        rows.append(f"_I check these every {format_interval(self.poll_interval)}, faster near your target! 🕐_")
+        levels_text = "".join(rows)
         await update.message.reply_text(levels_text, parse_mode='Markdown')
         
     async def remove_level_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /remove command"""
         user_id = update.effective_user.id
         
-        if user_id not in self.user_levels or not self.user_levels[user_id]:
+        user_levels = self.user_levels.get(user_id, {})
+        if not user_levels:
             await update.message.reply_text("📭 No levels to remove!")
             return
             
         try:
             if not context.args:
-                # Show interactive buttons if no symbol specified
+                # Show interactive buttons if no symbol specified.
+                # Buttons carry a short numeric token instead of the symbol to keep
+                # callback_data small; tokens keep counting up so stale keyboards
+                # can't remove the wrong level.
+                first_token = context.user_data.get("remove_token_next", 0)
+                remove_tokens = {}
                 keyboard = []
-                for symbol in self.user_levels[user_id].keys():
-                    level = self.user_levels[user_id][symbol]
+                for token, (symbol, level) in enumerate(user_levels.items(), first_token):
+                    remove_tokens[token] = symbol
                     button_text = f"{symbol} @ ${level.target_price:,.2f}"
-                    keyboard.append([InlineKeyboardButton(button_text, callback_data=f"remove_{symbol}")])
+                    keyboard.append([InlineKeyboardButton(button_text, callback_data=f"rm:{token}")])
                     
+                context.user_data["remove_tokens"] = remove_tokens
+                context.user_data["remove_token_next"] = first_token + len(remove_tokens)
+                
                 keyboard.append([InlineKeyboardButton("❌ Cancel", callback_data="cancel")])
                 reply_markup = InlineKeyboardMarkup(keyboard)
                 
@@ -261,8 +456,8 @@ Let's catch those perfect entries! 🎯"""
                 
             # Direct removal with symbol argument
             symbol = context.args[0].upper()
-            if symbol in self.user_levels[user_id]:
-                removed_level = self.user_levels[user_id].pop(symbol)
+            removed_level = await self.pop_level(user_id, symbol)
+            if removed_level is not None:
                 await update.message.reply_text(
                     f"🗑️ **Level Removed**\n\n"
                     f"Stopped monitoring {symbol} @ ${removed_level.target_price:,.4f}"
@@ -279,87 +474,374 @@ Let's catch those perfect entries! 🎯"""
         query = update.callback_query
         await query.answer()
         
+        # Dispatch on the action prefix ("rm:3" -> "rm")
+        handler = self._callback_handlers.get(query.data.partition(":")[0])
+        if handler is not None:
+            await handler(query, context)
+            
+    async def cancel_button_callback(self, query, context: ContextTypes.DEFAULT_TYPE):
+        """Handle the Cancel button"""
+        await query.edit_message_text("❌ Cancelled.")
+        
+    async def remove_button_callback(self, query, context: ContextTypes.DEFAULT_TYPE):
+        """Handle a remove-level button"""
         user_id = query.from_user.id
         
-        if query.data == "cancel":
-            await query.edit_message_text("❌ Cancelled.")
-            return
-            
-        if query.data.startswith("remove_"):
-            symbol = query.data.replace("remove_", "")
-            if user_id in self.user_levels and symbol in self.user_levels[user_id]:
-                removed_level = self.user_levels[user_id].pop(symbol)
-                await query.edit_message_text(
-                    f"🗑️ **Level Removed**\n\n"
-                    f"Stopped monitoring {symbol} @ ${removed_level.target_price:,.4f}"
-                )
-            else:
-                await query.edit_message_text("❌ Level not found.")
+        match = REMOVE_CALLBACK_RE.match(query.data)
+        symbol = context.user_data.get("remove_tokens", {}).get(int(match.group(1))) if match else None
+        removed_level = await self.pop_level(user_id, symbol) if symbol is not None else None
+        if removed_level is not None:
+            await query.edit_message_text(
+                f"🗑️ **Level Removed**\n\n"
+                f"Stopped monitoring {symbol} @ ${removed_level.target_price:,.4f}"
+            )
+        else:
+            await query.edit_message_text("❌ Level not found.")
+                
+    async def fetch_json(self, url: str, timeout: aiohttp.ClientTimeout = BINANCE_TIMEOUT,
+                         retries: int = BINANCE_MAX_RETRIES):
+        """GET a Binance URL and return the decoded JSON, retrying timeouts.
+        
+        Raises BinanceHTTPError on non-200 responses and BinanceRateLimited on
+        429/418, after which every request fails fast until Retry-After passes.
+        """
+        for attempt in range(retries + 1):
+            remaining = self._binance_backoff_until - time.monotonic()
+            if remaining > 0:
+                raise BinanceRateLimited(429, url, remaining)
+                
+            try:
+                async with self._binance_sem:
+                    async with self._session.get(url, timeout=timeout) as response:
+                        if response.status in (418, 429):
+                            try:
+                                retry_after = float(response.headers.get('Retry-After', BINANCE_DEFAULT_RETRY_AFTER))
+                            except ValueError:
+                                retry_after = BINANCE_DEFAULT_RETRY_AFTER
+                            self._binance_backoff_until = time.monotonic() + retry_after
+                            logger.warning(f"🛑 Binance rate limit ({response.status}), backing off for {retry_after:g}s")
+                            raise BinanceRateLimited(response.status, url, retry_after)
+                        if response.status != 200:
+                            raise BinanceHTTPError(response.status, url)
+                        # orjson parses the large ticker/exchangeInfo payloads much faster
+                        return orjson.loads(await response.read())
+                    
+            except asyncio.TimeoutError:
+                if attempt == retries:
+                    raise
+                delay = BINANCE_RETRY_BACKOFF * 2 ** attempt
+                logger.warning(f"⏳ Binance request timed out, retry {attempt + 1}/{retries} in {delay:g}s")
+                await asyncio.sleep(delay)
                 
     async def get_binance_price(self, symbol: str) -> Optional[float]:
-        """Get current price from Binance API"""
+        """Get current price from Binance API (served from cache when fresh)"""
+        cached = self._price_cache.get(symbol)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+            
         try:
             url = f"https://api.binance.com/api/v3/ticker/price?symbol={symbol}"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return float(data['price'])
-                        
+            data = await self.fetch_json(url)
+            price = float(data['price'])
+            self._price_cache[symbol] = (price, time.monotonic() + PRICE_CACHE_TTL)
+            return price
+            
         except Exception as e:
             logger.error(f"Error fetching price for {symbol}: {e}")
             
         return None
         
-    async def price_monitoring_loop(self):
-        """Main monitoring loop - checks every 5 minutes"""
-        self.monitoring = True
-        logger.info("🔄 Started price monitoring (every 5 minutes)")
-        
-        while True:
+    async def get_known_symbols(self) -> Optional[Set[str]]:
+        """Get tradable Binance symbols, refreshed lazily once a day"""
+        if time.monotonic() < self._known_symbols_expiry:
+            return self._known_symbols
+            
+        async with self._known_symbols_lock:
+            # Another caller may have refreshed the list while we waited
+            if time.monotonic() < self._known_symbols_expiry:
+                return self._known_symbols
+                
             try:
-                await self.check_all_levels()
-                await asyncio.sleep(300)  # 5 minutes
+                url = "https://api.binance.com/api/v3/exchangeInfo?permissions=SPOT"
+                
+                # Large payload - allow more time to read it, but don't retry
+                data = await self.fetch_json(url, timeout=aiohttp.ClientTimeout(total=15, connect=2), retries=0)
+                self._known_symbols = {
+                    item['symbol'] for item in data['symbols'] if item.get('status') == 'TRADING'
+                }
+                self._known_symbols_expiry = time.monotonic() + SYMBOLS_REFRESH_INTERVAL
+                logger.info(f"📚 Loaded {len(self._known_symbols)} Binance symbols")
+                return self._known_symbols
+                
             except Exception as e:
-                logger.error(f"Error in monitoring loop: {e}")
-                await asyncio.sleep(60)  # Retry after 1 minute on error
+                logger.error(f"Error fetching Binance symbols: {e}")
+                
+            # On failure keep using the previous list (None means validate by price only)
+            # and back off so every /add doesn't retry the download
+            self._known_symbols_expiry = time.monotonic() + SYMBOLS_RETRY_INTERVAL
+            return self._known_symbols
+        
+    async def get_many_prices(self, symbols: Set[str]) -> Dict[str, float]:
+        """Get current prices for several symbols with a single Binance API call"""
+        if not symbols:
+            return {}
+            
+        try:
+            symbols_param = urllib.parse.quote(orjson.dumps(sorted(symbols)).decode())
+            url = f"https://api.binance.com/api/v3/ticker/price?symbols={symbols_param}"
+            
+            data = await self.fetch_json(url)
+            prices = {item['symbol']: float(item['price']) for item in data}
+            
+            # Share results with /list and /add until the next sweep
+            expiry = time.monotonic() + PRICE_CACHE_TTL
+            for symbol, price in prices.items():
+                self._price_cache[symbol] = (price, expiry)
+            return prices
+            
+        except BinanceRateLimited as e:
+            # Binance wants fewer requests - skip this tick rather than fan out
+            logger.warning(f"Skipping price check for {len(symbols)} symbols: rate limited for {e.retry_after:g}s")
+            return {}
+        except BinanceHTTPError as e:
+            if e.status != 400:
+                logger.error(f"Error fetching prices for {len(symbols)} symbols: {e}")
+                return {}
+            logger.warning(f"Bulk price request rejected (invalid symbol?): {e}")
+        except Exception as e:
+            logger.error(f"Error fetching prices for {len(symbols)} symbols: {e}")
+            return {}
+            
+        # 400 means a symbol was delisted since the last symbol refresh. Refresh the
+        # symbol list soon so check_all_levels can drop it, and meanwhile fall back
+        # to one request per symbol; fetch_json's semaphore bounds the burst
+        self._known_symbols_expiry = min(self._known_symbols_expiry, time.monotonic() + SYMBOLS_RETRY_INTERVAL)
+        logger.warning(f"Falling back to per-symbol price requests for {len(symbols)} symbols")
+        symbol_list = sorted(symbols)
+        results = await asyncio.gather(*(self.get_binance_price(symbol) for symbol in symbol_list))
+        return {symbol: price for symbol, price in zip(symbol_list, results) if price is not None}
+        
+    async def load_levels(self):
+        """Open the levels database and rebuild the in-memory indexes from it"""
+        self._db = await aiosqlite.connect(self.db_path)
+        await self._db.execute("PRAGMA journal_mode=WAL")
+        await self._db.execute(
+            "CREATE TABLE IF NOT EXISTS levels ("
+            "user_id INTEGER, symbol TEXT, target_price REAL, created_at TEXT, "
+            "PRIMARY KEY(user_id, symbol))"
+        )
+        await self._db.commit()
+        
+        count = 0
+        invalid = []
+        async with self._db.execute("SELECT user_id, symbol, target_price, created_at FROM levels") as cursor:
+            async for user_id, symbol, target_price, created_at in cursor:
+                # NaN is stored as NULL; such rows would break every sweep
+                if target_price is None or not (math.isfinite(target_price) and target_price > 0):
+                    invalid.append((user_id, symbol))
+                    continue
+                    
+                level = TargetLevel(
+                    symbol=symbol,
+                    target_price=target_price,
+                    created_at=datetime.fromisoformat(created_at)
+                )
+                self.user_levels[user_id][symbol] = level
+                self._watchers[symbol][user_id] = level
+                # Restored levels keep next_poll_at=0.0, so they're checked straight away
+                count += 1
+                
+        if invalid:
+            await self._db.executemany("DELETE FROM levels WHERE user_id = ? AND symbol = ?", invalid)
+            await self._db.commit()
+            logger.warning(f"🗑️ Deleted {len(invalid)} saved levels with an invalid target price")
+            
+        logger.info(f"💾 Restored {count} levels from {self.db_path}")
+        
+    async def set_level(self, user_id: int, level: TargetLevel, current_price: Optional[float] = None):
+        """Save a level to the database, then store and schedule it in memory"""
+        async with self._levels_lock:
+            # Write first so a failed save leaves memory untouched
+            await self._db.execute(
+                "INSERT OR REPLACE INTO levels (user_id, symbol, target_price, created_at) VALUES (?, ?, ?, ?)",
+                (user_id, level.symbol, level.target_price, level.created_at.isoformat())
+            )
+            await self._db.commit()
+            
+            self.user_levels[user_id][level.symbol] = level
+            self._watchers[level.symbol][user_id] = level
+            self.schedule_level(level, current_price)
+            
+    async def pop_level(self, user_id: int, symbol: str,
+                        expected: Optional[TargetLevel] = None) -> Optional[TargetLevel]:
+        """Delete a user's level from the database, then from memory and the watchers index.
+        
+        With expected set, nothing is removed unless that exact level is still stored.
+        """
+        async with self._levels_lock:
+            level = self.user_levels.get(user_id, {}).get(symbol)
+            if level is None or (expected is not None and level is not expected):
+                return None
                 
+            # Delete first so a failed delete leaves the level in place
+            await self._db.execute("DELETE FROM levels WHERE user_id = ? AND symbol = ?", (user_id, symbol))
+            await self._db.commit()
+            
+            del self.user_levels[user_id][symbol]
+            watchers = self._watchers.get(symbol)
+            if watchers is not None:
+                watchers.pop(user_id, None)
+                if not watchers:
+                    del self._watchers[symbol]
+            return level
+        
+    def schedule_level(self, level: TargetLevel, current_price: Optional[float], now: Optional[float] = None):
+        """Set the next check time for a level based on how close price is to target.
+        
+        Pass the sweep's start time as now so deadlines line up with job ticks
+        instead of drifting by the fetch duration.
+        """
+        if current_price is None:
+            delay = min(60, self.poll_interval)  # Price unknown - retry soon
+        else:
+            distance_pct = (current_price - level.target_price) / current_price * 100
+            if distance_pct < HOT_DISTANCE_PCT:
+                delay = min(HOT_POLL_INTERVAL, self.poll_interval)
+            elif distance_pct < WARM_DISTANCE_PCT:
+                delay = min(WARM_POLL_INTERVAL, self.poll_interval)
+            else:
+                delay = self.poll_interval
+                
+        if now is None:
+            now = time.monotonic()
+        level.next_poll_at = now + delay
+        
+    async def monitor_job(self, context: ContextTypes.DEFAULT_TYPE):
+        """Job queue callback - checks levels whose deadline has passed"""
+        started = time.monotonic()
+        await self.check_all_levels()
+        
+        elapsed = time.monotonic() - started
+        if elapsed > self.poll_interval:
+            logger.warning(f"⚠️ Price check took {elapsed:.1f}s, longer than the {self.poll_interval:g}s poll interval")
+            
     async def check_all_levels(self):
-        """Check all user levels for target hits"""
+        """Check levels whose poll deadline has passed for target hits"""
+        now = time.monotonic()
+        due_by = now + POLL_TOLERANCE
+        
+        # Deadlines live on the levels themselves, so a failed sweep leaves them due
+        due_symbols = {
+            symbol
+            for symbol, watchers in self._watchers.items()
+            if any(level.next_poll_at <= due_by for level in watchers.values())
+        }
+        if not due_symbols:
+            return
+            
+        # A symbol that stopped trading makes Binance reject the whole bulk request,
+        # so drop those levels instead of retrying them forever
+        known_symbols = await self.get_known_symbols()
+        if known_symbols is not None:
+            delisted = due_symbols - known_symbols
+            if delisted:
+                await self.drop_delisted_levels(delisted)
+                due_symbols -= delisted
+                if not due_symbols:
+                    return
+                    
+        # One request for every due symbol instead of one per level
+        prices = await self.get_many_prices(due_symbols)
         total_checks = 0
+        hits = []
         
-        for user_id, user_levels in self.user_levels.items():
-            for symbol, level in list(user_levels.items()):  # list() to avoid modification during iteration
-                current_price = await self.get_binance_price(symbol)
+        # Single pass over due symbols; no awaits, so the indexes can't change under us
+        for symbol in due_symbols:
+            watchers = self._watchers.get(symbol)
+            if not watchers:
+                continue  # Removed while we were fetching
+            current_price = prices.get(symbol)
+            
+            for user_id, level in watchers.items():
+                if level.next_poll_at > due_by:
+                    continue
                 if current_price is None:
+                    self.schedule_level(level, None, now)
                     continue
                     
                 total_checks += 1
                 
                 # Check if price dropped to/below target (long entry condition)
                 if current_price <= level.target_price:
-                    await self.send_target_hit_alert(user_id, level, current_price)
-                    # Remove level after alert (one-time alert)
-                    del self.user_levels[user_id][symbol]
+                    hits.append((user_id, level, current_price))
+                else:
+                    self.schedule_level(level, current_price, now)
                     
+        # Remove hit levels after the loop (one-time alert)
+        now_dt = datetime.now()
+        alert_time = now_dt.strftime('%Y-%m-%d %H:%M:%S')
+        alert_coros = []
+        for user_id, level, current_price in hits:
+            try:
+                # Skips levels replaced by /add while an earlier removal was being saved
+                removed = await self.pop_level(user_id, level.symbol, expected=level)
+            except Exception as e:
+                # Level stays stored and due, so it is checked again next tick
+                logger.error(f"Error removing {level.symbol} for user {user_id}: {e}")
+                continue
+            if removed is None:
+                continue
+            alert_coros.append(self.send_target_hit_alert(user_id, level, current_price, alert_time))
+            
+        # Send alerts concurrently; the rate limiter keeps us within Telegram's limits
+        if alert_coros:
+            await asyncio.gather(*alert_coros, return_exceptions=True)
+            
         if total_checks > 0:
-            logger.info(f"✅ Checked {total_checks} levels at {datetime.now().strftime('%H:%M:%S')}")
+            logger.info(f"✅ Checked {total_checks} levels at {now_dt.strftime('%H:%M:%S')}")
+                    
+    async def drop_delisted_levels(self, symbols: Set[str]):
+        """Remove levels on symbols that are no longer trading and tell their owners"""
+        notices = []
+        for symbol in symbols:
+            for user_id, level in list(self._watchers.get(symbol, {}).items()):
+                try:
+                    removed = await self.pop_level(user_id, symbol, expected=level)
+                except Exception as e:
+                    logger.error(f"Error removing delisted {symbol} for user {user_id}: {e}")
+                    continue
+                if removed is None:
+                    continue
                     
-    async def send_target_hit_alert(self, user_id: int, level: TargetLevel, current_price: float):
+                logger.info(f"🗑️ Removed {symbol} level for user {user_id}: symbol no longer trading")
+                notices.append(self.application.bot.send_message(
+                    chat_id=user_id,
+                    text=(
+                        f"⚠️ **{symbol}** is no longer trading on Binance.\n\n"
+                        f"Your target at ${level.target_price:,.4f} has been removed."
+                    ),
+                    parse_mode='Markdown'
+                ))
+                
+        if notices:
+            await asyncio.gather(*notices, return_exceptions=True)
+            
+    async def send_target_hit_alert(self, user_id: int, level: TargetLevel, current_price: float,
+                                    alert_time: Optional[str] = None):
         """Send alert when target level is hit"""
+        if alert_time is None:
+            alert_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            
         try:
             drop_percent = ((level.target_price - current_price) / level.target_price * 100)
             
-            alert_text = (
-                f"🚨 **TARGET HIT!** 🚨\n\n"
-                f"📊 **{level.symbol}** dropped to your level!\n\n"
-                f"🎯 **Target:** ${level.target_price:,.4f}\n"
-                f"💰 **Current:** ${current_price:,.4f}\n"
-                f"📉 **Extra Drop:** {abs(drop_percent):.2f}% below target\n\n"
-                f"⏰ **Time:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-                f"🚀 **Perfect for long entry!** This level has been removed from monitoring.\n\n"
-                f"_Add new levels with /add command_"
+            alert_text = ALERT_TMPL.format(
+                symbol=level.symbol,
+                target=level.target_price,
+                current=current_price,
+                drop=abs(drop_percent),
+                time=alert_time
             )
             
             await self.application.bot.send_message(
@@ -388,7 +870,24 @@ async def main():
         print("4. Copy the token and set it as BOT_TOKEN environment variable")
         return
         
-    bot = CryptoLongEntryBot(BOT_TOKEN)
+    POLL_INTERVAL_S = float(os.getenv('POLL_INTERVAL_S', '300'))
+    # Point DB_PATH at persistent storage (e.g. a Render disk) - the working
+    # directory is wiped on redeploy, taking saved levels with it
+    DB_PATH = os.getenv('DB_PATH', 'levels.db')
+    
+    # Webhook mode is enabled by setting WEBHOOK_HOST (e.g. crypto-alert-bot.onrender.com)
+    WEBHOOK_HOST = os.getenv('WEBHOOK_HOST')
+    WEBHOOK_PORT = int(os.getenv('PORT', '8443'))
+    WEBHOOK_SECRET = os.getenv('WEBHOOK_SECRET')
+    
+    bot = CryptoLongEntryBot(
+        BOT_TOKEN,
+        poll_interval=POLL_INTERVAL_S,
+        db_path=DB_PATH,
+        webhook_host=WEBHOOK_HOST,
+        webhook_port=WEBHOOK_PORT,
+        webhook_secret=WEBHOOK_SECRET
+    )
     
     try:
         logger.info("🚀 Starting Crypto Long Entry Alert Bot...")